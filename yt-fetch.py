@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import os
 import sys
 import re
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import List, Optional, Any, Dict
 
@@ -21,9 +31,31 @@ except Exception:
     _console = None
 # =============================================
 
+# ============== Optional HTTP/2 (curl_cffi) ==============
+# yt-dlp routes requests through curl_cffi when impersonating a browser; that handler
+# speaks HTTP/2 and keeps connections alive across a video's fragments.
+# Importing yt-dlp's handler (not just curl_cffi) fails for curl_cffi versions yt-dlp
+# doesn't support, in which case the "chrome" target would not be available.
+HAVE_HTTP2 = False
+try:
+    import yt_dlp.networking._curlcffi  # noqa: F401
+    from yt_dlp.networking.impersonate import ImpersonateTarget
+    HAVE_HTTP2 = True
+except Exception:
+    ImpersonateTarget = None
+# =========================================================
+
+# Resolved (flat) metadata from dry-runs, keyed by input string
+CACHE_DIR = Path("~/.cache/yt-fetch").expanduser()
+
+# Logger patterns (compiled once; the logger sees every yt-dlp message)
+_RE_403 = re.compile(r"\bHTTP(?:\s+Error)?\s*403\b", re.I)
+_RE_FF = re.compile(r"ffmpeg|post-?process", re.I)
+
 
 # ---------------- Helpers ----------------
 
+@lru_cache(maxsize=4)
 def pick_formats(mode: str, container: str) -> str:
     """Choose formats per mode to avoid unnecessary downloads."""
     if mode == "mp3":
@@ -36,30 +68,41 @@ def pick_formats(mode: str, container: str) -> str:
     return "bestvideo*+bestaudio/best"
 
 
+@lru_cache(maxsize=16)
 def build_postprocessors(mode: str, container: str, embed_metadata: bool, embed_thumbnail: bool):
-    """Postprocessors depend on mode and metadata toggle."""
+    """
+    Postprocessors depend on mode and metadata toggle.
+    Cached, so returns immutable (key, value) tuples; expand with dict() per use.
+    """
     pps = []
     if embed_metadata:
-        pps.append({"key": "FFmpegMetadata", "add_chapters": True})
+        pps.append((("key", "FFmpegMetadata"), ("add_chapters", True)))
         if embed_thumbnail:
             if mode == "mp3":
-                pps.append({"key": "FFmpegThumbnailsConvertor", "format": "jpg"})
-            pps.append({"key": "EmbedThumbnail"})
+                pps.append((("key", "FFmpegThumbnailsConvertor"), ("format", "jpg")))
+            pps.append((("key", "EmbedThumbnail"),))
     if mode == "mp3":
-        pps.append({"key": "FFmpegExtractAudio", "preferredcodec": "mp3", "preferredquality": "320"})
+        pps.append((("key", "FFmpegExtractAudio"), ("preferredcodec", "mp3"), ("preferredquality", "320")))
     else:
         if container.lower() == "mp4":
-            pps.append({"key": "FFmpegVideoRemuxer", "preferedformat": "mp4"})
-    return pps
+            pps.append((("key", "FFmpegVideoRemuxer"), ("preferedformat", "mp4")))
+    return tuple(pps)
+
+
+# Output templates keyed by --flat
+TEMPLATES = {
+    True: "%(title)s [%(id)s].%(ext)s",
+    False: "%(uploader)s/%(title)s [%(id)s].%(ext)s",
+}
 
 
 def make_outtmpl(flat: bool) -> str:
     """Return a RELATIVE template. paths:{home: OUT_DIR} will place it."""
-    return "%(title)s [%(id)s].%(ext)s" if flat else "%(uploader)s/%(title)s [%(id)s].%(ext)s"
+    return TEMPLATES[bool(flat)]
 
 
 def is_url(s: str) -> bool:
-    return s.startswith("http://") or s.startswith("https://")
+    return s.startswith(("http://", "https://"))
 
 
 def to_search_expr(query: str, limit: int) -> str:
@@ -76,19 +119,74 @@ def prepare_inputs(target: Optional[str], search: Optional[str], search_limit: i
 
 
 def parse_bulk_file(path: Path, search_limit: int) -> List[str]:
-    results = []
-    with path.open("r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            results.append(line if is_url(line) else to_search_expr(line, search_limit))
-    return results
+    """One decode pass over the whole file, then a single comprehension over its lines."""
+    data = path.read_text(encoding="utf-8", errors="replace")
+    # is_url/to_search_expr inlined: this runs once per line
+    return [ln if ln.startswith(("http://", "https://")) else f"ytsearch{search_limit}:{ln}"
+            for raw in data.splitlines() if (ln := raw.strip()) and not ln.startswith("#")]
+
+
+# -------------- Metadata cache --------------
+
+def _cache_path(item: str) -> Path:
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def cache_load(item: str, ttl: float) -> Optional[dict]:
+    """Return cached info for `item` if younger than `ttl` seconds (ttl <= 0 disables)."""
+    if ttl <= 0:
+        return None
+    path = _cache_path(item)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_store(item: str, info: dict):
+    # Best effort: a cache write failure must never break a run
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _cache_path(item)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def expand_cached_inputs(inputs: List[str], ttl: float) -> List[str]:
+    """
+    Replace search/playlist inputs already resolved by a recent dry-run with their
+    entry URLs, so the download skips re-running the search/playlist extraction.
+    Only entry URLs are reused; formats are always extracted fresh (stream URLs expire).
+    Inputs whose flat entries aren't all full URLs (e.g. bare IDs that only resolve
+    together with their ie_key) are kept as-is.
+    """
+    expanded = []
+    for it in inputs:
+        info = cache_load(it, ttl)
+        entries = (info or {}).get("entries") or []
+        urls = [e.get("webpage_url") or e.get("url") for e in entries if e]
+        if urls and all(isinstance(u, str) and is_url(u) for u in urls):
+            expanded.extend(urls)
+        else:
+            expanded.append(it)
+    return expanded
 
 
 # -------------- State / Logger / Hooks --------------
 
 class HookState:
+    # Touched on every hook/log call; slots keep attribute access cheap
+    __slots__ = ("total_items", "completed_items", "seen_403", "ffmpeg_issue",
+                 "task_id", "progress", "progress_broken")
+
     def __init__(self):
         self.total_items = 0
         self.completed_items = 0
@@ -96,53 +194,92 @@ class HookState:
         self.ffmpeg_issue = False
         self.task_id = None
         self.progress: Optional[Progress] = None
+        self.progress_broken = False
+
+
+def _noop(msg):
+    pass
 
 
 class YDLLogger:
+    __slots__ = ("state", "verbose", "debug", "info")
+
     def __init__(self, state: HookState, verbose: bool):
         self.state = state
         self.verbose = verbose
-        self._re_403 = re.compile(r"\bHTTP(?:\s+Error)?\s*403\b", re.I)
-
-    def debug(self, msg):
-        if self.verbose:
-            print(msg)
+        # yt-dlp calls debug() constantly during extraction: pick the sink once, not per call
+        self.debug = print if verbose else _noop
+        self.info = print if verbose else _noop
 
-    def info(self, msg):
-        if self.verbose:
-            print(msg)
+    def _scan(self, msg):
+        state = self.state
+        if state.seen_403 and state.ffmpeg_issue:
+            return
+        s = str(msg)
+        if not state.seen_403 and _RE_403.search(s):
+            state.seen_403 = True
+        if not state.ffmpeg_issue and _RE_FF.search(s):
+            state.ffmpeg_issue = True
 
     def warning(self, msg):
-        s = str(msg)
-        if self._re_403.search(s):
-            self.state.seen_403 = True
-        if "ffmpeg" in s.lower() or "postprocess" in s.lower():
-            self.state.ffmpeg_issue = True
+        self._scan(msg)
         if self.verbose:
             print(msg, file=sys.stderr)
 
     def error(self, msg):
-        s = str(msg)
-        if self._re_403.search(s):
-            self.state.seen_403 = True
-        if "ffmpeg" in s.lower() or "postprocess" in s.lower():
-            self.state.ffmpeg_issue = True
+        self._scan(msg)
         print(msg, file=sys.stderr)
 
 
 def progress_hook_factory(state: HookState):
+    lock = threading.Lock()
+
     def hook(d: Dict[str, Any]):
-        # Called frequently; count file-level completion on "finished"
+        # Called frequently; count file-level completion on "finished".
+        # Only the counter is touched here; progress_refresher redraws the bar.
         if d.get("status") == "finished":
-            state.completed_items += 1
-            if state.progress and state.task_id is not None:
-                try:
-                    state.progress.update(state.task_id, completed=state.completed_items)
-                except Exception:
-                    pass
+            with lock:
+                state.completed_items += 1
     return hook
 
 
+@contextlib.contextmanager
+def progress_refresher(state: HookState, interval: float = 0.2):
+    """
+    Push state.completed_items to the Rich bar from a side thread, off yt-dlp's download path.
+    Bars run with auto_refresh=False, so this redraws only when the count moved (<= 5 Hz).
+    """
+    last = -1
+
+    def refresh():
+        nonlocal last
+        p, tid = state.progress, state.task_id
+        if p is not None and tid is not None and state.completed_items != last:
+            last = state.completed_items
+            p.update(tid, completed=last)
+            p.refresh()
+
+    stop = threading.Event()
+
+    def loop():
+        # One guard for the whole loop: if Rich ever raises, stop updating the bar
+        try:
+            while not stop.wait(interval):
+                refresh()
+        except Exception:
+            state.progress_broken = True
+
+    t = threading.Thread(target=loop, name="yt-fetch-progress", daemon=True)
+    t.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        t.join()
+        if not state.progress_broken:
+            refresh()
+
+
 # -------------- Build yt-dlp options --------------
 
 def get_common_opts(
@@ -160,8 +297,15 @@ def get_common_opts(
     cookies_file: Optional[str],
     cookies_from_browser: Optional[str],
     embed_metadata: bool,
+    embed_thumbnail: bool,
+    write_description: bool,
+    write_info_json: bool,
     keep_video: bool,
     redownload: bool,
+    concurrent_fragments: int,
+    aria2c_connections: int,
+    aria2c_split: int,
+    http2: bool,
     state: HookState,
 ) -> dict:
     logger = YDLLogger(state, verbose)
@@ -171,10 +315,11 @@ def get_common_opts(
         "paths": {"home": str(output_dir)},
         "outtmpl": outtmpl,
         "ignoreerrors": True,
-        # side files only if metadata is on
-        "writethumbnail": bool(embed_metadata),
-        "writedescription": bool(embed_metadata),
-        "writeinfojson": bool(embed_metadata),
+        # the thumbnail is only fetched to be embedded (EmbedThumbnail removes it afterwards);
+        # description/info JSON side files are opt-in
+        "writethumbnail": bool(embed_metadata and embed_thumbnail),
+        "writedescription": bool(write_description),
+        "writeinfojson": bool(write_info_json),
         "writesubtitles": write_subs,
         "subtitleslangs": ["all"],
         "merge_output_format": "mkv",
@@ -187,7 +332,6 @@ def get_common_opts(
         "fragment_retries": fragment_retries,
         "sleep_interval": sleep,
         "max_sleep_interval": (sleep_max if sleep_max and sleep_max >= sleep else None),
-        "concurrent_fragment_downloads": 2,
         "quiet": not verbose,
         "no_warnings": not verbose,
         "forceipv4": force_ipv4,
@@ -195,12 +339,30 @@ def get_common_opts(
         # overwrite behavior
         "overwrites": bool(redownload),
         "keepvideo": bool(keep_video),
+        # HLS/DASH fragments always go through yt-dlp's native downloaders (aria2c only
+        # takes plain http/ftp URLs), so this applies with or without --aria2c
+        "concurrent_fragment_downloads": max(1, concurrent_fragments),
     }
     if not redownload and download_archive:
         common["download_archive"] = str(download_archive)
     if use_aria2c:
         common["external_downloader"] = "aria2c"
-        common["external_downloader_args"] = ["-x8", "-s8", "-k1M", "--summary-interval=0"]
+        # aria2c caps connections per server at 16
+        aria2c_args = [
+            f"-x{min(max(1, aria2c_connections), 16)}",
+            f"-s{max(1, aria2c_split)}",
+            "-k1M",
+            "--summary-interval=0",
+        ]
+        if sys.platform.startswith("linux"):
+            # fallocate() is O(1) on ext4/xfs/btrfs instead of zero-filling the file
+            aria2c_args.append("--file-allocation=falloc")
+        common["external_downloader_args"] = aria2c_args
+    else:
+        if http2 and HAVE_HTTP2:
+            common["impersonate"] = ImpersonateTarget("chrome")
+            # let the impersonated client send its own matching User-Agent
+            common["http_headers"] = {}
     if cookies_file:
         common["cookiefile"] = cookies_file
     if cookies_from_browser:
@@ -226,52 +388,180 @@ def build_opts(
     cookies_from_browser: Optional[str],
     embed_metadata: bool,
     embed_thumbnail: bool,
+    write_description: bool,
+    write_info_json: bool,
     keep_video: bool,
     redownload: bool,
+    concurrent_fragments: int,
+    aria2c_connections: int,
+    aria2c_split: int,
+    http2: bool,
     state: HookState,
 ) -> dict:
     fmt = pick_formats(mode, container)
     opts = get_common_opts(
         output_dir, outtmpl, download_archive, use_aria2c, verbose, write_subs,
         retries, fragment_retries, sleep, sleep_max, force_ipv4,
-        cookies_file, cookies_from_browser, embed_metadata, keep_video, redownload, state
+        cookies_file, cookies_from_browser, embed_metadata, embed_thumbnail,
+        write_description, write_info_json, keep_video, redownload,
+        concurrent_fragments, aria2c_connections, aria2c_split, http2, state
     )
     opts.update({
         "format": fmt,
-        "postprocessors": build_postprocessors(mode, container, embed_metadata, embed_thumbnail and embed_metadata),
+        "postprocessors": [dict(pp) for pp in build_postprocessors(
+            mode, container, embed_metadata, embed_thumbnail and embed_metadata)],
         # Sometimes helps with YouTube throttling
         "extractor_args": {"youtube": {"player_client": ["android"]}},
     })
     return opts
 
 
-def run_ydl(inputs: List[str], ydl_opts: dict, state: HookState):
+def _bulk_progress():
+    # Redrawn manually by progress_refresher; no idle timer wakeups
+    return Progress(
+        TextColumn("[bold]yt-fetch[/bold]"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        transient=False,
+        disable=False,
+        auto_refresh=False,
+    )
+
+
+def _throttled_redraw(prog, min_interval: float = 0.2):
+    """Return redraw(force=False) that calls prog.refresh() at most every min_interval seconds."""
+    last = 0.0
+
+    def redraw(force: bool = False):
+        nonlocal last
+        now = time.monotonic()
+        if force or now - last >= min_interval:
+            last = now
+            prog.refresh()
+    return redraw
+
+
+# Per-process counter shared with the parent (set by _init_worker in each child)
+_shared_completed = None
+
+
+def _init_worker(counter):
+    global _shared_completed
+    _shared_completed = counter
+    # Never draw into the parent's Rich Live display from a worker
+    sys.stdout = sys.__stdout__
+    sys.stderr = sys.__stderr__
+
+
+def _download_shard(shard: List[str], opt_args: dict):
+    """
+    Child-process entry point. Logger/hooks aren't picklable, so options are
+    rebuilt here from plain arguments with a process-local HookState.
+    """
+    state = HookState()
+    state.total_items = len(shard)
+    ydl_opts = build_opts(**opt_args, state=state)
+
+    def bump(d: Dict[str, Any]):
+        if d.get("status") == "finished":
+            with _shared_completed.get_lock():
+                _shared_completed.value += 1
+
+    ydl_opts["progress_hooks"].append(bump)
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        code = ydl.download(shard)
+    return code, state.seen_403, state.ffmpeg_issue
+
+
+def _abort_pool(exe: ProcessPoolExecutor):
+    """Cancel queued shards and stop running workers (exit would otherwise wait on them)."""
+    terminate = getattr(exe, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    procs = list((getattr(exe, "_processes", None) or {}).values())
+    exe.shutdown(wait=False, cancel_futures=True)
+    for proc in procs:
+        proc.terminate()
+
+
+def _run_parallel(inputs: List[str], opt_args: dict, state: HookState, workers: int):
+    shards = [inputs[i::workers] for i in range(workers)]
+    # "spawn": the parent is multi-threaded (Rich Live + progress_refresher) by now, and
+    # forking it could copy a held console lock or the redirected stdout into workers
+    ctx = multiprocessing.get_context("spawn")
+    counter = ctx.Value("i", 0)
+    exe = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                              initializer=_init_worker, initargs=(counter,))
+    try:
+        futures = [exe.submit(_download_shard, shard, opt_args) for shard in shards]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+            state.completed_items = counter.value
+            for f in done:
+                if f.exception() is not None:
+                    raise f.exception()
+    except BaseException:
+        # Fail fast: don't sit in shutdown(wait=True) until the other shards finish
+        _abort_pool(exe)
+        raise
+    exe.shutdown(wait=True)
+
+    code = 0
+    for f in futures:
+        shard_code, seen_403, ffmpeg_issue = f.result()
+        code = max(code, shard_code or 0)
+        state.seen_403 = state.seen_403 or seen_403
+        state.ffmpeg_issue = state.ffmpeg_issue or ffmpeg_issue
+    return code
+
+
+def run_ydl(inputs: List[str], opt_args: dict, state: HookState, parallel_videos: int = 1):
+    # Drop repeated inputs (keeping order): with --parallel-videos two copies could land in
+    # different processes, each with its own archive view, and write the same file at once
+    inputs = list(dict.fromkeys(inputs))
+    state.total_items = len(inputs)
+    workers = min(parallel_videos, len(inputs))
     # Optional progress UI (bulk)
     if USE_RICH and len(inputs) > 1:
-        with Progress(
-            TextColumn("[bold]yt-fetch[/bold]"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-            transient=False,
-            disable=False
-        ) as prog:
+        with _bulk_progress() as prog:
             state.progress = prog
-            state.task_id = prog.add_task("bulk", total=len(inputs))
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.download(inputs)
+            state.task_id = prog.add_task("bulk", total=state.total_items)
+            with progress_refresher(state):
+                if workers > 1:
+                    return _run_parallel(inputs, opt_args, state, workers)
+                with yt_dlp.YoutubeDL(build_opts(**opt_args, state=state)) as ydl:
+                    return ydl.download(inputs)
     else:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        if workers > 1:
+            return _run_parallel(inputs, opt_args, state, workers)
+        with yt_dlp.YoutubeDL(build_opts(**opt_args, state=state)) as ydl:
             return ydl.download(inputs)
 
 
 # ----------------- Dry-run -----------------
 
-def dry_run_list(items: List[str]):
+async def _resolve_all(items: List[str], resolve, concurrency: int, on_done):
+    """Run resolve(item) on a bounded thread pool; results keep input order."""
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as exe:
+        async def worker(it):
+            res = await loop.run_in_executor(exe, resolve, it)
+            on_done(it)
+            return res
+        return await asyncio.gather(*(worker(it) for it in items))
+
+
+def dry_run_list(items: List[str], concurrency: int = 8, cache_ttl: float = 0, deep: bool = False):
     """
     dry-run:
-    - Uses extract_flat to avoid format probing & extra requests.
+    - Uses extract_flat="in_playlist": playlist/search entries are listed without per-entry requests.
+    - With `deep`, entries missing a duration are resolved afterwards on a 16-thread pool.
+    - Resolves up to `concurrency` inputs in parallel (one YoutubeDL per worker thread).
+    - Reuses results cached on disk within `cache_ttl` seconds and caches new ones.
     - Shows a progress bar with rich (if present).
     - Lists (title, id, uploader/channel, duration if available, URL).
     """
@@ -282,13 +572,16 @@ def dry_run_list(items: List[str]):
         "no_warnings": True,
         "skip_download": True,
         "simulate": True,
-        "extract_flat": True,      # key speed-up
+        "extract_flat": "in_playlist",      # key speed-up
         "lazy_playlist": True,
         "socket_timeout": 10,
         "retries": 2,
         "fragment_retries": 1,
         "cachedir": True,
+        "check_formats": False,    # metadata only, never probe format URLs
         "http_headers": {"User-Agent": "Mozilla/5.0"},
+        # metadata-only fetches don't need the slower android client used for downloads
+        "extractor_args": {"youtube": {"player_client": ["web"]}},
     }
 
     total = len(items)
@@ -306,7 +599,7 @@ def dry_run_list(items: List[str]):
                     "id": e.get("id"),
                     "uploader": e.get("uploader") or e.get("channel"),
                     "duration": e.get("duration"),
-                    "webpage_url": e.get("webpage_url"),
+                    "webpage_url": e.get("webpage_url") or e.get("url"),
                 })
         else:
             results.append({
@@ -317,48 +610,106 @@ def dry_run_list(items: List[str]):
                 "webpage_url": info_obj.get("webpage_url"),
             })
 
-    if USE_RICH:
-        with Progress(
-            TextColumn("[bold]yt-fetch dry-run[/bold]"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeElapsedColumn(),
-            transient=False,
-        ) as prog:
+    # yt-dlp extractor state isn't safe to share across threads: one instance per worker
+    local = threading.local()
+    lock = threading.Lock()
+
+    with contextlib.ExitStack() as stack:
+        def _ydl():
+            ydl = getattr(local, "ydl", None)
+            if ydl is None:
+                ydl = yt_dlp.YoutubeDL(ydl_opts)
+                with lock:
+                    stack.enter_context(ydl)
+                local.ydl = ydl
+            return ydl
+
+        def resolve(it):
+            cached = cache_load(it, cache_ttl)
+            if cached is not None:
+                return True, cached
+            ydl = _ydl()
+            try:
+                info = ydl.extract_info(it, download=False)
+            except Exception:
+                return False, None
+            if info and cache_ttl > 0:
+                cache_store(it, ydl.sanitize_info(info))
+            return True, info
+
+        def deepen(url):
+            # process=False: metadata only, no format selection
+            try:
+                return _ydl().extract_info(url, download=False, process=False)
+            except Exception:
+                return None
+
+        if USE_RICH:
+            prog = stack.enter_context(Progress(
+                TextColumn("[bold]yt-fetch dry-run[/bold]"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeElapsedColumn(),
+                transient=False,
+                auto_refresh=False,
+            ))
             task = prog.add_task("scan", total=total)
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                for it in items:
-                    try:
-                        info = ydl.extract_info(it, download=False)
-                        _collect(info)
-                    except Exception:
-                        results.append({
-                            "title": f"[error resolving] {it}",
-                            "id": "",
-                            "uploader": "",
-                            "duration": None,
-                            "webpage_url": "",
-                        })
-                    processed += 1
-                    prog.update(task, completed=processed)
-    else:
-        print(f"yt-fetch dry-run: resolving {total} item(s)...")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            for it in items:
-                try:
-                    info = ydl.extract_info(it, download=False)
-                    _collect(info)
-                except Exception:
-                    results.append({
-                        "title": f"[error resolving] {it}",
-                        "id": "",
-                        "uploader": "",
-                        "duration": None,
-                        "webpage_url": "",
-                    })
+            redraw = _throttled_redraw(prog)
+
+            def on_done(it):
+                nonlocal processed
+                processed += 1
+                # update() is cheap without auto_refresh; only the redraw is throttled
+                prog.update(task, completed=processed)
+                redraw(force=processed == total)
+        else:
+            print(f"yt-fetch dry-run: resolving {total} item(s)...")
+
+            def on_done(it):
+                nonlocal processed
                 processed += 1
                 print(f"  [{processed}/{total}] {it}")
 
+        resolved = asyncio.run(_resolve_all(items, resolve, concurrency, on_done))
+
+        for it, (ok, info) in zip(items, resolved):
+            if ok:
+                _collect(info)
+            else:
+                results.append({
+                    "title": f"[error resolving] {it}",
+                    "id": "",
+                    "uploader": "",
+                    "duration": None,
+                    "webpage_url": "",
+                })
+
+        # Optional second pass: flat playlist entries often lack duration
+        todo = [r for r in results if r["duration"] is None and r["webpage_url"]] if deep else []
+        if todo:
+            if USE_RICH:
+                deep_task = prog.add_task("deep", total=len(todo))
+                deep_done = 0
+
+                def on_deep(url):
+                    nonlocal deep_done
+                    deep_done += 1
+                    prog.update(deep_task, completed=deep_done)
+                    redraw(force=deep_done == len(todo))
+            else:
+                print(f"yt-fetch dry-run: fetching details for {len(todo)} entries...")
+
+                def on_deep(url):
+                    pass
+
+            infos = asyncio.run(_resolve_all([r["webpage_url"] for r in todo], deepen, 16, on_deep))
+            for r, info in zip(todo, infos):
+                if not info:
+                    continue
+                r["title"] = r["title"] or info.get("title")
+                r["uploader"] = r["uploader"] or info.get("uploader") or info.get("channel")
+                r["duration"] = info.get("duration")
+
     # ---- Display results ----
     if USE_RICH:
         table = Table(title="yt-fetch dry-run (no downloads)")
@@ -367,12 +718,13 @@ def dry_run_list(items: List[str]):
         table.add_column("Uploader", style="magenta")
         table.add_column("Duration (s)", style="green")
         table.add_column("URL", style="blue")
-        for r in results:
-            table.add_row(r["title"] or "",
-                          r["id"] or "",
-                          r["uploader"] or "",
-                          str(r["duration"] or ""),
-                          r["webpage_url"] or "")
+        rows = [(r["title"] or "",
+                 r["id"] or "",
+                 r["uploader"] or "",
+                 str(r["duration"] or ""),
+                 r["webpage_url"] or "") for r in results]
+        for row in rows:
+            table.add_row(*row)
         _console.print(table)
     else:
         print("\nyt-fetch dry-run (no downloads):")
@@ -412,13 +764,25 @@ def main():
     p.add_argument("--flat", action="store_true", help="Put all outputs directly into the output folder (no per-uploader subfolders).")
 
     # metadata
-    p.add_argument("--no-metadata", action="store_true", help="Disable writing/embedding metadata, thumbnails, info JSON, and description.")
+    p.add_argument("--no-metadata", action="store_true", help="Disable embedding metadata, chapters, and thumbnails.")
+    p.add_argument("--write-description", action="store_true", help="Also save the video description as a .description file.")
+    p.add_argument("--write-info-json", action="store_true", help="Also save yt-dlp's metadata as a .info.json file.")
 
     # stability & extras
     p.add_argument("--aria2c", action="store_true", help="Use aria2c external downloader for speed.")
     p.add_argument("--no-aria2c", action="store_true", help="Force-disable aria2c (overrides --aria2c).")
+    p.add_argument("--aria2c-connections", type=int, default=16,
+                   help="aria2c connections per server, max 16 (default: 16).")
+    p.add_argument("--aria2c-split", type=int, default=16,
+                   help="aria2c pieces each file is split into (default: 16).")
+    p.add_argument("--http2", action="store_true",
+                   help="Download over HTTP/2 via curl_cffi (needs a yt-dlp-supported curl_cffi; ignored with aria2c).")
+    p.add_argument("--concurrent-fragments", type=int, default=5,
+                   help="Fragments downloaded in parallel for HLS/DASH streams (default: 5).")
     p.add_argument("--subs", action="store_true", help="Download and embed available subtitles.")
     p.add_argument("--verbose", action="store_true", help="Verbose output.")
+    p.add_argument("--parallel-videos", type=int, default=1,
+                   help="Download this many items at once, each in its own process (default: 1).")
     p.add_argument("--force-ipv4", action="store_true", help="Use IPv4 only (can avoid 403s on some networks).")
     p.add_argument("--cookies-file", help="Path to a cookies.txt file.")
     p.add_argument("--cookies-from-browser",
@@ -434,6 +798,12 @@ def main():
     # dry-run
     p.add_argument("--dry-run", action="store_true",
                    help="Resolve inputs and list what would be downloaded (no files saved). Best with --bulk-file.")
+    p.add_argument("--deep-dry-run", action="store_true",
+                   help="With --dry-run, also fetch details (duration) for each playlist/search entry. Slower.")
+    p.add_argument("--cache-ttl", type=float, default=6.0,
+                   help=f"Hours to reuse dry-run results cached in {CACHE_DIR} (default: 6; 0 disables).")
+    p.add_argument("--dry-run-concurrency", type=int, default=8,
+                   help="Inputs resolved in parallel during --dry-run (default: 8).")
 
     args = p.parse_args()
 
@@ -445,10 +815,15 @@ def main():
 
     download_archive = None if (args.no_archive or args.redownload) else args.archive
     use_aria2c = args.aria2c and not args.no_aria2c
+    if args.http2 and not use_aria2c and not HAVE_HTTP2:
+        print("[yt-fetch] --http2 needs a curl_cffi version supported by your yt-dlp "
+              "(python -m pip install -U \"yt-dlp[curl-cffi]\"); continuing over HTTP/1.1.",
+              file=sys.stderr)
 
     outtmpl = make_outtmpl(flat=args.flat)
     embed_metadata = not args.no_metadata
     embed_thumbnail = True
+    cache_ttl = args.cache_ttl * 3600
 
     # Build inputs
     targets: List[str] = []
@@ -466,14 +841,17 @@ def main():
 
     # Dry-run: list and exit
     if args.dry_run:
-        sys.exit(dry_run_list(targets))
+        sys.exit(dry_run_list(targets, concurrency=args.dry_run_concurrency,
+                              cache_ttl=cache_ttl, deep=args.deep_dry_run))
+
+    targets = expand_cached_inputs(targets, cache_ttl)
 
     # Progress/state
     state = HookState()
     state.total_items = len(targets)
 
-    # Build options
-    ydl_opts = build_opts(
+    # Options are kept as plain arguments so --parallel-videos workers can rebuild them
+    opt_args = dict(
         mode=args.mode,
         container=args.container,
         output_dir=output_dir,
@@ -491,17 +869,21 @@ def main():
         cookies_from_browser=args.cookies_from_browser,
         embed_metadata=embed_metadata,
         embed_thumbnail=embed_thumbnail,
+        write_description=args.write_description,
+        write_info_json=args.write_info_json,
         keep_video=args.keep_video,
         redownload=args.redownload,
-        state=state,
+        concurrent_fragments=args.concurrent_fragments,
+        aria2c_connections=args.aria2c_connections,
+        aria2c_split=args.aria2c_split,
+        http2=args.http2,
     )
 
     code = 1  # default to failure unless set by run
     try:
-        code = run_ydl(targets, ydl_opts, state)
+        code = run_ydl(targets, opt_args, state, parallel_videos=args.parallel_videos)
     except Exception as e:
-        msg = str(e)
-        if re.search(r"(ffmpeg|postprocess|post-processing|Postprocessing)", msg, re.I):
+        if _RE_FF.search(str(e)):
             print("\n[yt-fetch] ffmpeg/postprocessing error detected. "
                   "Try again with --redownload (and optionally -k/--keep-video).", file=sys.stderr)
         raise